@@ -0,0 +1,10 @@
+"""Shared fixtures for ThreadMap tests."""
+import pytest
+
+from threadmap.examples.apt28_2016 import build_apt28_chain
+
+
+@pytest.fixture(scope="session")
+def apt28_chain():
+    """The APT28 example chain, built once per session. Do not mutate."""
+    return build_apt28_chain()
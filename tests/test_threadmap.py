@@ -1,6 +1,8 @@
 """Tests for ThreadMap MVP."""
+import io
 import json
 import pytest
+from pydantic import ValidationError
 
 from threadmap.models import (
     Actor, Action, Capability, Infrastructure, Narrative, Target, Effect,
@@ -11,7 +13,7 @@ from threadmap.chain import HybridChain
 from threadmap.analysis import (
     find_chokepoints, narrative_threads, capability_requirements, intervention_ranking,
 )
-from threadmap.io import to_json, from_json, to_stix_bundle, to_markdown
+from threadmap.io import to_json, from_json, to_stix_bundle, to_stix_json, to_markdown
 from threadmap.examples.apt28_2016 import build_apt28_chain
 
 
@@ -56,6 +58,11 @@ class TestModels:
         assert a.success_probability == 0.5
         assert a.attack_ids == []
 
+    def test_entities_frozen(self):
+        a = Action(id="x", name="X", domain=ActionDomain.CYBER)
+        with pytest.raises(ValidationError):
+            a.name = "Y"
+
     def test_all_entity_types(self):
         """All 7 entity types can be instantiated."""
         entities = [
@@ -93,6 +100,28 @@ class TestHybridChain:
         cp = simple_chain.get_critical_path()
         assert "act2" in cp  # longest duration node
 
+    def test_critical_path_duration(self, simple_chain, apt28_chain):
+        def hours(chain, path):
+            return sum(chain.get_entity(n).duration_hours or 0
+                       for n in path if isinstance(chain.get_entity(n), Action))
+
+        cp = simple_chain.get_critical_path()
+        assert cp == ["a1", "act1", "act2", "act3", "eff1"]
+        assert hours(simple_chain, cp) == 84
+        assert hours(apt28_chain, apt28_chain.get_critical_path()) == 3048
+
+    def test_readd_relationship_overwrites(self, simple_chain):
+        simple_chain.add_relationship(Relationship(
+            source_id="act1", target_id="act2", edge_type=EdgeType.ENABLES,
+            resource_id="cap1", description="updated",
+        ))
+        rels = [r for r in simple_chain.relationships
+                if (r["source"], r["target"]) == ("act1", "act2")]
+        assert rels == [{"source": "act1", "target": "act2", "edge_type": EdgeType.ENABLES,
+                         "resource_id": "cap1", "description": "updated"}]
+        assert len(simple_chain.relationships) == 7
+        assert simple_chain.in_degree("act2") == 2
+
     def test_intervention_score(self, simple_chain):
         score = simple_chain.intervention_score("act1")
         assert score >= 1  # at least act2 downstream
@@ -107,6 +136,34 @@ class TestHybridChain:
         actions = simple_chain.get_entities_by_type(Action)
         assert len(actions) == 3
 
+    def test_as_csr(self, simple_chain):
+        pytest.importorskip("numpy")
+        indptr, indices = simple_chain.as_csr()
+        assert len(indptr) == len(simple_chain.entities) + 1
+        assert len(indices) == len(simple_chain.relationships)
+        i = simple_chain._idx["act3"]
+        succ = {simple_chain._rev_idx[j] for j in indices[indptr[i]:indptr[i + 1]]}
+        assert succ == {"eff1", "nar1"}
+
+    def test_bulk_load(self):
+        chain = HybridChain("x", "X")
+        chain.bulk_load(
+            [Actor(id="a", name="A", actor_type=ActorType.STATE),
+             Action(id="b", name="B", domain=ActionDomain.CYBER)],
+            [Relationship(source_id="a", target_id="b")],
+        )
+        assert len(chain.entities) == 2
+        assert chain.get_chain() == ["a", "b"]
+
+    def test_bulk_load_missing_endpoint(self):
+        chain = HybridChain("x", "X")
+        with pytest.raises(ValueError):
+            chain.bulk_load(
+                [Actor(id="a", name="A", actor_type=ActorType.STATE)],
+                [Relationship(source_id="a", target_id="nonexistent")],
+            )
+        assert len(chain.entities) == 0
+
 
 # --- Analysis Tests ---
 
@@ -123,6 +180,47 @@ class TestAnalysis:
         for thread in threads:
             assert "nar1" in thread
 
+    def test_narrative_threads_deduplicated(self):
+        chain = HybridChain("x", "X")
+        chain.add_entity(Action(id="s", name="S"))
+        for nid in ("n1", "n2"):
+            chain.add_entity(Narrative(id=nid, name=nid, narrative_type=NarrativeType.LEAK))
+        chain.add_entity(Effect(id="e", name="E", effect_type=EffectType.DATA_LOSS))
+        for src, tgt in (("s", "n1"), ("n1", "n2"), ("n2", "e"), ("s", "n2")):
+            chain.add_relationship(Relationship(source_id=src, target_id=tgt))
+        # s->n1->n2->e passes through both narratives but is listed once
+        threads = narrative_threads(chain)
+        assert threads == [["s", "n1", "n2", "e"], ["s", "n2", "e"]]
+
+    def test_narrative_threads_order(self, simple_chain):
+        # Ordered by source, then sink, then edge insertion order, like the
+        # source/sink/all_simple_paths enumeration this replaced
+        simple_chain.add_entity(Narrative(id="nar2", name="Second wave",
+                                          narrative_type=NarrativeType.LEAK))
+        simple_chain.add_relationship(Relationship(source_id="act3", target_id="nar2"))
+        assert narrative_threads(simple_chain) == [
+            ["a1", "act1", "act2", "act3", "nar1", "t1"],
+            ["a1", "act1", "act2", "act3", "nar2"],
+            ["cap1", "act2", "act3", "nar1", "t1"],
+            ["cap1", "act2", "act3", "nar2"],
+        ]
+
+    def test_narrative_threads_isolated(self):
+        chain = HybridChain("x", "X")
+        chain.add_entity(Narrative(id="n", name="N", narrative_type=NarrativeType.LEAK))
+        assert narrative_threads(chain) == [["n"]]
+        assert narrative_threads(HybridChain("y", "Y")) == []
+
+    def test_narrative_threads_cyclic(self):
+        chain = HybridChain("x", "X")
+        chain.add_entity(Action(id="s", name="S"))
+        chain.add_entity(Action(id="a", name="A"))
+        chain.add_entity(Narrative(id="n", name="N", narrative_type=NarrativeType.LEAK))
+        chain.add_entity(Effect(id="e", name="E", effect_type=EffectType.DATA_LOSS))
+        for src, tgt in (("s", "a"), ("a", "n"), ("n", "a"), ("n", "e")):
+            chain.add_relationship(Relationship(source_id=src, target_id=tgt))
+        assert narrative_threads(chain) == [["s", "a", "n", "e"]]
+
     def test_capability_requirements(self, simple_chain):
         caps = capability_requirements(simple_chain)
         cap_names = [c["name"] for c in caps]
@@ -135,6 +233,53 @@ class TestAnalysis:
         # Should be sorted by score descending
         scores = [r["score"] for r in rankings]
         assert scores == sorted(scores, reverse=True)
+        # Only Action scores are weighted by a float probability
+        by_id = {r["node_id"]: r for r in rankings}
+        assert by_id["a1"]["score"] == 6 and isinstance(by_id["a1"]["score"], int)
+        assert by_id["act2"]["score"] == round(4 * 3 * 1.7, 2)
+
+    def test_reach_counts_cyclic(self):
+        chain = HybridChain("x", "X")
+        for nid in "abcd":
+            chain.add_entity(Action(id=nid, name=nid.upper()))
+        for src, tgt in ("ab", "bc", "cb", "cd"):
+            chain.add_relationship(Relationship(source_id=src, target_id=tgt))
+        assert not chain.is_valid_dag()
+
+        cps = {c["node_id"]: c for c in find_chokepoints(chain)}
+        assert {n: c["downstream_count"] for n, c in cps.items()} == {"a": 3, "b": 2, "c": 2, "d": 0}
+        assert {n: c["upstream_count"] for n, c in cps.items()} == {"a": 0, "b": 2, "c": 2, "d": 3}
+        rankings = intervention_ranking(chain)
+        assert {r["node_id"]: r["downstream_impact"] for r in rankings} == {
+            n: chain.intervention_score(n) for n in "abcd"
+        }
+
+    def test_compiled_reach_counts(self, simple_chain):
+        pytest.importorskip("numba")
+        from threadmap.analysis import _reach_counts_compiled
+
+        order = simple_chain.get_chain()
+        assert _reach_counts_compiled(simple_chain, order[::-1], False) == {
+            n: simple_chain.intervention_score(n) for n in order
+        }
+        ancestors = _reach_counts_compiled(simple_chain, order, True)
+        assert ancestors["t1"] == 6
+        assert ancestors["a1"] == 0
+
+    def test_compiled_critical_path(self, simple_chain):
+        pytest.importorskip("numba")
+        order = simple_chain.get_chain()
+        durations = {n: 0.0 for n in order} | {"act1": 24.0, "act2": 48.0, "act3": 12.0}
+        assert simple_chain._critical_path_compiled(order, durations) == \
+            simple_chain.get_critical_path()
+
+    def test_swar_popcount(self):
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("numba")
+        from threadmap._kernels import swar_popcount
+
+        words = np.array([0, 1, 0xFF, 2**64 - 1, 0x8000000000000001], dtype=np.uint64)
+        assert swar_popcount(words).tolist() == [0, 1, 8, 64, 2]
 
 
 # --- IO Tests ---
@@ -147,6 +292,11 @@ class TestIO:
         assert len(restored.entities) == len(simple_chain.entities)
         assert len(restored.relationships) == len(simple_chain.relationships)
 
+    def test_json_roundtrip_validated(self, simple_chain):
+        restored = from_json(to_json(simple_chain), trusted=False)
+        assert dict(restored.entities) == dict(simple_chain.entities)
+        assert restored.relationships == simple_chain.relationships
+
     def test_stix_bundle(self, simple_chain):
         bundle = to_stix_bundle(simple_chain)
         assert bundle["type"] == "bundle"
@@ -155,6 +305,54 @@ class TestIO:
         rel_objs = [o for o in bundle["objects"] if o["type"] == "relationship"]
         assert len(rel_objs) > 0
 
+    def test_markdown_report_tracks_mutation(self, simple_chain):
+        before = to_markdown(simple_chain)
+        assert to_markdown(simple_chain) == before
+
+        simple_chain.add_entity(Action(id="act4", name="Cover tracks", duration_hours=100))
+        after_entity = to_markdown(simple_chain)
+        assert "Cover tracks" in after_entity
+
+        simple_chain.add_relationship(Relationship(source_id="act3", target_id="act4"))
+        after_rel = to_markdown(simple_chain)
+        assert "`act3` →[dependency]→ `act4`" in after_rel
+        # The memoized critical path is recomputed through the new edge
+        cp = after_rel.split("## Critical Path\n\n")[1].split("\n")[0]
+        assert cp.endswith("`act3` → `act4`")
+        assert after_rel != after_entity
+
+    def test_relationships_not_shared(self, simple_chain):
+        before = to_json(simple_chain)
+        simple_chain.relationships[0]["target"] = "bogus"
+        assert simple_chain.relationships[0]["target"] == "act1"
+        assert to_json(simple_chain) == before
+
+    def test_stix_bundle_not_shared(self, simple_chain):
+        before = to_json(simple_chain)
+        bundle = to_stix_bundle(simple_chain)
+        act2 = next(o for o in bundle["objects"] if o["id"] == "attack-pattern--act2")
+        act2["x_threadmap"]["tools"].append("X")
+        assert to_json(simple_chain) == before
+        fresh = next(o for o in to_stix_bundle(simple_chain)["objects"]
+                     if o["id"] == "attack-pattern--act2")
+        assert fresh["x_threadmap"]["tools"] == ["metasploit"]
+
+    def test_stix_json(self, simple_chain):
+        def strip(bundle):
+            return [{k: v for k, v in o.items() if k not in ("created", "modified")}
+                    for o in bundle["objects"]]
+
+        streamed = json.loads(to_stix_json(simple_chain))
+        assert streamed["id"] == "bundle--test-chain"
+        assert strip(streamed) == strip(to_stix_bundle(simple_chain))
+
+    def test_stix_json_builds_no_records(self, simple_chain):
+        # Streaming reads the relationship columns; no per-edge dicts or
+        # snapshot should be built and cached
+        to_stix_json(simple_chain, stream=io.StringIO())
+        assert simple_chain._snapshot_cached is None
+        assert "relationships" not in simple_chain._cache
+
     def test_markdown_report(self, simple_chain):
         md = to_markdown(simple_chain)
         assert "# ThreadMap Report" in md
@@ -170,29 +368,34 @@ class TestAPT28Example:
         assert chain.chain_id == "chain-apt28-election-2016"
         assert chain.is_valid_dag()
 
-    def test_has_all_entity_types(self):
-        chain = build_apt28_chain()
-        types_present = {type(e).__name__ for e in chain.entities.values()}
+    def test_build_chain_independent(self):
+        first = build_apt28_chain()
+        first.get_entity("action-spearphish").tools.append("LEAK")
+        assert "LEAK" not in build_apt28_chain().get_entity("action-spearphish").tools
+
+    def test_has_all_entity_types(self, apt28_chain):
+        types_present = {type(e).__name__ for e in apt28_chain.entities.values()}
         assert types_present == {"Actor", "Action", "Capability", "Infrastructure",
                                   "Narrative", "Target", "Effect"}
 
-    def test_critical_path(self):
-        chain = build_apt28_chain()
-        cp = chain.get_critical_path()
+    def test_critical_path(self, apt28_chain):
+        cp = apt28_chain.get_critical_path()
         assert len(cp) > 0
 
-    def test_intervention_ranking(self):
-        chain = build_apt28_chain()
-        rankings = intervention_ranking(chain)
+    def test_intervention_ranking(self, apt28_chain):
+        rankings = intervention_ranking(apt28_chain)
         assert len(rankings) > 0
 
-    def test_json_export(self):
-        chain = build_apt28_chain()
-        j = to_json(chain)
+    def test_json_export(self, apt28_chain):
+        j = to_json(apt28_chain)
         data = json.loads(j)
         assert data["id"] == "chain-apt28-election-2016"
 
-    def test_markdown_report(self):
-        chain = build_apt28_chain()
-        md = to_markdown(chain)
+    def test_infrastructure_description(self, apt28_chain):
+        bundle = to_stix_bundle(apt28_chain)
+        infra = next(o for o in bundle["objects"] if o["id"] == "infrastructure--infra-dcleaks")
+        assert infra["description"].startswith("GRU-operated")
+
+    def test_markdown_report(self, apt28_chain):
+        md = to_markdown(apt28_chain)
         assert "APT28" in md
@@ -0,0 +1,73 @@
+"""Optional Numba-compiled kernels for large-chain analysis.
+
+Requires the ``fast`` extra (numpy + numba). When either is missing,
+``HAVE_NUMBA`` is False and callers use their pure-Python paths.
+"""
+from __future__ import annotations
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # optional dependency
+    np = None
+    njit = None
+
+HAVE_NUMBA = njit is not None
+
+# Below this many nodes the pure-Python paths win once array setup and
+# kernel dispatch are counted.
+MIN_NODES = 1000
+
+
+if HAVE_NUMBA:
+    @njit(cache=True)
+    def descendant_reach(indptr, indices, order_rev, reach):
+        """OR each node's reach bitset with those of its CSR neighbors.
+
+        ``reach`` is an (N, ceil(N/64)) uint64 array with each node's own
+        bit set; ``order_rev`` visits nodes so neighbors come first.
+        """
+        width = reach.shape[1]
+        for i in range(order_rev.size):
+            v = order_rev[i]
+            for e in range(indptr[v], indptr[v + 1]):
+                c = indices[e]
+                for w in range(width):
+                    reach[v, w] |= reach[c, w]
+
+    @njit(cache=True)
+    def longest_path(indptr, indices, topo, weights):
+        """Node-weighted longest-path DP over CSR adjacency.
+
+        Returns ``(dist, pred)``; ``pred`` is -1 for nodes with no
+        predecessor on their best path.
+        """
+        dist = weights.copy()
+        pred = np.full(weights.size, -1, dtype=np.int32)
+        for i in range(topo.size):
+            u = topo[i]
+            for e in range(indptr[u], indptr[u + 1]):
+                v = indices[e]
+                cand = dist[u] + weights[v]
+                if cand > dist[v] or pred[v] < 0:
+                    dist[v] = cand
+                    pred[v] = u
+        return dist, pred
+
+    _M1 = np.uint64(0x5555555555555555)
+    _M2 = np.uint64(0x3333333333333333)
+    _M4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+    _H01 = np.uint64(0x0101010101010101)
+
+    def swar_popcount(x):
+        """Per-word popcount of a uint64 array using SWAR bit tricks."""
+        x = x - ((x >> np.uint64(1)) & _M1)
+        x = (x & _M2) + ((x >> np.uint64(2)) & _M2)
+        x = (x + (x >> np.uint64(4))) & _M4
+        return (x * _H01) >> np.uint64(56)
+
+    def popcount_rows(bits):
+        """Number of set bits in each row of a uint64 array."""
+        if hasattr(np, "bitwise_count"):  # NumPy >= 2.0
+            return np.bitwise_count(bits).sum(axis=1, dtype=np.int64)
+        return swar_popcount(bits).sum(axis=1, dtype=np.int64)
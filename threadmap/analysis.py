@@ -1,12 +1,89 @@
 """Chain analysis functions for ThreadMap."""
 from __future__ import annotations
 
-from typing import Any
-
-import networkx as nx
+import heapq
+from typing import Any, Callable, Iterable, Iterator
 
+from . import _kernels
 from .chain import HybridChain
-from .models import Action, Capability, Narrative
+from .models import Action, Capability, Narrative, TYPE_CODE
+
+_ACTION = TYPE_CODE[Action]
+
+
+def _reach_counts(chain: HybridChain, reverse: bool = False) -> dict[str, int]:
+    """Count the nodes reachable from every node in one topological pass.
+
+    Each node's reachable set is an ``int`` bitset built as the union of its
+    children's sets, visiting nodes in reverse topological order. With
+    ``reverse=True`` edges are followed backwards (ancestor counts). Cyclic
+    chains have no topological order and fall back to one DFS per node.
+    """
+    if not chain.is_valid_dag():
+        return _reach_counts_dfs(chain, reverse)
+    order = chain.get_chain()
+    if not reverse:
+        order.reverse()
+    if _kernels.HAVE_NUMBA and len(order) >= _kernels.MIN_NODES:
+        return _reach_counts_compiled(chain, order, reverse)
+
+    idx = chain._idx
+    neighbors = chain.predecessors if reverse else chain.successors
+    reach: dict[str, int] = {}
+    for v in order:
+        bits = 1 << idx[v]
+        for c in neighbors(v):
+            bits |= reach[c]
+        reach[v] = bits
+    return {v: bin(bits).count("1") - 1 for v, bits in reach.items()}
+
+
+def _reach_counts_dfs(chain: HybridChain, reverse: bool) -> dict[str, int]:
+    """`_reach_counts` by a separate DFS from every node; works on cycles."""
+    neighbors = chain.predecessors if reverse else chain.successors
+    counts: dict[str, int] = {}
+    for node_id in chain.entities:
+        seen = {node_id}
+        stack = [node_id]
+        while stack:
+            for v in neighbors(stack.pop()):
+                if v not in seen:
+                    seen.add(v)
+                    stack.append(v)
+        counts[node_id] = len(seen) - 1
+    return counts
+
+
+def _reach_counts_compiled(
+    chain: HybridChain, order: list[str], reverse: bool,
+) -> dict[str, int]:
+    """`_reach_counts` on packed uint64 bitsets via the Numba kernel.
+
+    ``order`` visits every node after all of the nodes it can reach.
+    """
+    np = _kernels.np
+    n = len(order)
+    indptr, indices = chain.as_csr(reverse=reverse)
+    idx = chain._idx
+    visit = np.fromiter((idx[v] for v in order), dtype=np.int32, count=n)
+
+    rows = np.arange(n, dtype=np.int32)
+    reach = np.zeros((n, (n + 63) // 64), dtype=np.uint64)
+    reach[rows, rows // 64] = np.left_shift(np.uint64(1), (rows % 64).astype(np.uint64))
+    _kernels.descendant_reach(indptr, indices, visit, reach)
+
+    counts = _kernels.popcount_rows(reach) - 1
+    return dict(zip(chain._rev_idx, counts.tolist()))
+
+
+def _descendant_counts(chain: HybridChain) -> dict[str, int]:
+    """Number of descendants of every node (shared, do not modify)."""
+    return chain._cached("descendant_counts", lambda: _reach_counts(chain))
+
+
+def _ancestor_counts(chain: HybridChain) -> dict[str, int]:
+    """Number of ancestors of every node (shared, do not modify)."""
+    return chain._cached("ancestor_counts", lambda: _reach_counts(chain, reverse=True))
 
 
 def find_chokepoints(chain: HybridChain, top_n: int = 10) -> list[dict[str, Any]]:
@@ -15,10 +92,12 @@ def find_chokepoints(chain: HybridChain, top_n: int = 10) -> list[dict[str, Any]
     Returns list of {node_id, entity_type, impact, downstream_count}
     sorted by impact descending.
     """
+    descendant_counts = _descendant_counts(chain)
+    ancestor_counts = _ancestor_counts(chain)
     results = []
-    for node_id in chain.graph.nodes:
-        descendants = len(nx.descendants(chain.graph, node_id))
-        ancestors = len(nx.ancestors(chain.graph, node_id))
+    for node_id in chain.entities:
+        descendants = descendant_counts[node_id]
+        ancestors = ancestor_counts[node_id]
         # Impact = downstream nodes disabled if this node is removed
         # Also consider how many upstream paths converge here (betweenness-like)
         impact = descendants
@@ -29,8 +108,7 @@ def find_chokepoints(chain: HybridChain, top_n: int = 10) -> list[dict[str, Any]
             "upstream_count": ancestors,
             "impact": impact,
         })
-    results.sort(key=lambda x: x["impact"], reverse=True)
-    return results[:top_n]
+    return heapq.nlargest(top_n, results, key=lambda x: x["impact"])
 
 
 def narrative_threads(chain: HybridChain) -> list[list[str]]:
@@ -38,22 +116,60 @@ def narrative_threads(chain: HybridChain) -> list[list[str]]:
 
     Returns list of paths (each path is a list of node IDs).
     """
-    narrative_ids = {e.id for e in chain.get_entities_by_type(Narrative)}
-    if not narrative_ids:
+    narratives = [e.id for e in chain.get_entities_by_type(Narrative)]
+    if not narratives:
         return []
 
-    sources = [n for n in chain.graph.nodes if chain.graph.in_degree(n) == 0]
-    sinks = [n for n in chain.graph.nodes if chain.graph.out_degree(n) == 0]
-
+    # Only enumerate source->narrative and narrative->sink segments instead
+    # of every source->sink path, then stitch the segments together.
     threads = []
-    for source in sources:
-        for sink in sinks:
-            for path in nx.all_simple_paths(chain.graph, source, sink):
-                if any(n in narrative_ids for n in path):
+    seen: set[tuple[str, ...]] = set()
+    for nid in narratives:
+        prefixes = [path[::-1] for path in _paths_to_end(nid, chain.predecessors)]
+        suffixes = list(_paths_to_end(nid, chain.successors))
+        for prefix in prefixes:
+            on_prefix = set(prefix)
+            for suffix in suffixes:
+                # On a cyclic chain the two halves can share nodes
+                if not on_prefix.isdisjoint(suffix[1:]):
+                    continue
+                path = prefix + suffix[1:]
+                key = tuple(path)
+                if key not in seen:
+                    seen.add(key)
                     threads.append(path)
+
+    # Order by source, then sink, then the insertion order of each edge
+    # taken, i.e. the order of a source-by-source, sink-by-sink DFS
+    idx = chain._idx
+    succ = chain._succ
+    threads.sort(key=lambda path: (
+        idx[path[0]], idx[path[-1]],
+        [succ[u][v] for u, v in zip(path, path[1:])],
+    ))
     return threads
 
 
+def _paths_to_end(
+    start: str, neighbors: Callable[[str], Iterable[str]],
+) -> Iterator[list[str]]:
+    """Yield every simple path from ``start`` that ends at a node with no neighbors.
+
+    Following successors this yields all paths to a sink; following
+    predecessors, all paths (reversed) back to a source. Nodes already on
+    the path are not revisited, so cycles cannot make the walk run forever.
+    """
+    stack = [[start]]
+    while stack:
+        path = stack.pop()
+        nbrs = list(neighbors(path[-1]))
+        if not nbrs:
+            yield path
+        for n in reversed(nbrs):
+            if n not in path:
+                stack.append(path + [n])
+
+
 def capability_requirements(chain: HybridChain) -> list[dict[str, Any]]:
     """What capabilities does a chain require?
 
@@ -83,7 +199,7 @@ def capability_requirements(chain: HybridChain) -> list[dict[str, Any]]:
     return caps
 
 
-def intervention_ranking(chain: HybridChain) -> list[dict[str, Any]]:
+def intervention_ranking(chain: HybridChain, top_n: int | None = None) -> list[dict[str, Any]]:
     """Rank possible intervention points by impact.
 
     For each node, compute:
@@ -91,32 +207,41 @@ def intervention_ranking(chain: HybridChain) -> list[dict[str, Any]]:
     - in_degree: how many paths converge here (harder to bypass)
     - score: composite ranking
 
-    Returns sorted list, highest priority first.
+    Returns sorted list, highest priority first (at most ``top_n`` entries
+    if given).
     """
-    rankings = []
-    for node_id in chain.graph.nodes:
-        entity = chain.get_entity(node_id)
-        downstream = len(nx.descendants(chain.graph, node_id))
-        in_deg = chain.graph.in_degree(node_id)
-        out_deg = chain.graph.out_degree(node_id)
-
-        # Nodes with high downstream impact AND that are convergence points
-        # (high in-degree) are the best intervention targets
-        score = downstream * (1 + in_deg)
-
-        # Actions with low success probability are natural weak points
-        if isinstance(entity, Action):
-            score *= (2.0 - entity.success_probability)
+    descendant_counts = _descendant_counts(chain)
+    entities = chain.entities
+    ids = list(entities)
+
+    # Score from per-node columns; result dicts are only built for the
+    # nodes that are returned.
+    type_code = chain._type_code
+    action_probs = {a.id: a.success_probability for a in chain.get_entities_by_type(Action)}
+    downstream = [descendant_counts[n] for n in ids]
+    in_degs = [chain.in_degree(n) for n in ids]
+    # Actions with low success probability are natural weak points
+    weights = [2.0 - action_probs[n] if type_code[n] == _ACTION else 1 for n in ids]
+    # Nodes with high downstream impact AND that are convergence points
+    # (high in-degree) are the best intervention targets
+    scores = [round(d * (1 + i) * w, 2) for d, i, w in zip(downstream, in_degs, weights)]
+
+    if top_n is None:
+        order = sorted(range(len(ids)), key=scores.__getitem__, reverse=True)
+    else:
+        order = heapq.nlargest(top_n, range(len(ids)), key=scores.__getitem__)
 
+    rankings = []
+    for k in order:
+        node_id = ids[k]
+        entity = entities[node_id]
         rankings.append({
             "node_id": node_id,
             "entity_type": type(entity).__name__,
             "name": getattr(entity, "name", node_id),
-            "downstream_impact": downstream,
-            "in_degree": in_deg,
-            "out_degree": out_deg,
-            "score": round(score, 2),
+            "downstream_impact": downstream[k],
+            "in_degree": in_degs[k],
+            "out_degree": chain.out_degree(node_id),
+            "score": scores[k],
         })
-
-    rankings.sort(key=lambda x: x["score"], reverse=True)
     return rankings
@@ -1,16 +1,32 @@
 """HybridChain - directed graph of hybrid operation entities and relationships."""
 from __future__ import annotations
 
-from typing import Any
+from array import array
+from collections import deque
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Mapping, NamedTuple
 
 import networkx as nx
 
+from . import _kernels
 from .models import (
     Entity, Relationship, Action, Actor, Capability,
-    Infrastructure, Narrative, Target, Effect, EdgeType,
+    Infrastructure, Narrative, Target, Effect, EdgeType, TYPE_CODE, EntityAdapter,
 )
 
 
+class RelationshipColumns(NamedTuple):
+    """Column-wise view of a chain's relationships, in insertion order.
+
+    The lists are the chain's own storage; do not modify them.
+    """
+    source: list[str]
+    target: list[str]
+    edge_type: list[EdgeType]
+    resource_id: list[str | None]
+    description: list[str]
+
+
 class HybridChain:
     """A directed graph representing a hybrid operation chain.
 
@@ -22,17 +38,38 @@ class HybridChain:
         self.chain_id = chain_id
         self.name = name
         self.description = description
-        self.graph = nx.DiGraph()
         self._entities: dict[str, Entity] = {}
+        self._entities_view = MappingProxyType(self._entities)
+        self._by_type: dict[type, list[Entity]] = {}
+        self._type_code: dict[str, int] = {}
+        # Dense integer index of every node, in insertion order
+        self._idx: dict[str, int] = {}
+        self._rev_idx: list[str] = []
+        # Relationships are stored column-wise, in insertion order
+        self._rel_src: list[str] = []
+        self._rel_tgt: list[str] = []
+        self._rel_type: list[EdgeType] = []
+        self._rel_resource: list[str | None] = []
+        self._rel_desc: list[str] = []
+        # Endpoints as dense node indexes, for array-based kernels
+        self._rel_src_ix = array("i")
+        self._rel_tgt_ix = array("i")
+        # Adjacency: source -> {target: relationship position}, target -> [sources]
+        self._succ: dict[str, dict[str, int]] = {}
+        self._pred: dict[str, list[str]] = {}
+        # Derived structures are cached against _version, which every
+        # mutation bumps.
+        self._version: int = 0
+        self._graph_cache: tuple[int, nx.DiGraph] | None = None
+        self._topo_cached: tuple[int, list[str]] | None = None
+        self._dag_cached: tuple[int, bool] | None = None
+        self._snapshot_cached: tuple[int, list[dict[str, Any]], list[dict[str, Any]]] | None = None
+        self._cache: dict[str, tuple[int, Any]] = {}
 
     def add_entity(self, entity: Entity) -> None:
         """Add an entity as a node in the graph."""
-        self._entities[entity.id] = entity
-        self.graph.add_node(
-            entity.id,
-            entity_type=type(entity).__name__,
-            data=entity,
-        )
+        self._insert_entity(entity)
+        self._version += 1
 
     def get_entity(self, entity_id: str) -> Entity | None:
         return self._entities.get(entity_id)
@@ -43,30 +80,206 @@ class HybridChain:
             raise ValueError(f"Source entity '{rel.source_id}' not in chain")
         if rel.target_id not in self._entities:
             raise ValueError(f"Target entity '{rel.target_id}' not in chain")
-        self.graph.add_edge(
-            rel.source_id,
-            rel.target_id,
-            edge_type=rel.edge_type,
-            resource_id=rel.resource_id,
-            description=rel.description,
-        )
+        self._insert_relationship(rel)
+        self._version += 1
+
+    def bulk_load(
+        self,
+        entities: Iterable[Entity],
+        relationships: Iterable[Relationship] = (),
+    ) -> None:
+        """Add many entities and relationships in one step.
+
+        Relationship endpoints may refer to entities already in the chain or
+        to any of ``entities``. All endpoints are validated up front, so the
+        chain is left untouched if any is missing.
+        """
+        entities = list(entities)
+        relationships = list(relationships)
+        endpoints = {r.source_id for r in relationships} | {r.target_id for r in relationships}
+        missing = endpoints - self._entities.keys() - {e.id for e in entities}
+        if missing:
+            raise ValueError(f"Relationship endpoints not in chain: {sorted(missing)}")
+
+        for entity in entities:
+            self._insert_entity(entity)
+        for rel in relationships:
+            self._insert_relationship(rel)
+        self._version += 1
+
+    def _insert_entity(self, entity: Entity) -> None:
+        old = self._entities.get(entity.id)
+        if old is not None:
+            self._by_type[type(old)].remove(old)
+        else:
+            self._idx[entity.id] = len(self._rev_idx)
+            self._rev_idx.append(entity.id)
+        self._entities[entity.id] = entity
+        self._by_type.setdefault(type(entity), []).append(entity)
+        self._type_code[entity.id] = next(
+            (TYPE_CODE[c] for c in type(entity).__mro__ if c in TYPE_CODE), -1)
+        self._succ.setdefault(entity.id, {})
+        self._pred.setdefault(entity.id, [])
+
+    def _insert_relationship(self, rel: Relationship) -> None:
+        succ = self._succ[rel.source_id]
+        pos = succ.get(rel.target_id)
+        if pos is not None:
+            self._rel_type[pos] = rel.edge_type
+            self._rel_resource[pos] = rel.resource_id
+            self._rel_desc[pos] = rel.description
+            return
+        succ[rel.target_id] = len(self._rel_src)
+        self._pred[rel.target_id].append(rel.source_id)
+        self._rel_src.append(rel.source_id)
+        self._rel_tgt.append(rel.target_id)
+        self._rel_type.append(rel.edge_type)
+        self._rel_resource.append(rel.resource_id)
+        self._rel_desc.append(rel.description)
+        self._rel_src_ix.append(self._idx[rel.source_id])
+        self._rel_tgt_ix.append(self._idx[rel.target_id])
+
+    def successors(self, node_id: str) -> Iterable[str]:
+        return self._succ[node_id].keys()
+
+    def predecessors(self, node_id: str) -> Iterable[str]:
+        return self._pred[node_id]
+
+    def in_degree(self, node_id: str) -> int:
+        return len(self._pred[node_id])
+
+    def out_degree(self, node_id: str) -> int:
+        return len(self._succ[node_id])
+
+    def as_csr(self, reverse: bool = False) -> tuple[Any, Any]:
+        """Adjacency as CSR ``(indptr, indices)`` int32 NumPy arrays.
+
+        Rows and column values use the dense node index (``_idx``). With
+        ``reverse=True`` rows list predecessors instead of successors.
+        Requires numpy.
+        """
+        import numpy as np
+
+        n = len(self._rev_idx)
+        src = np.frombuffer(self._rel_src_ix, dtype=np.intc).astype(np.int32)
+        tgt = np.frombuffer(self._rel_tgt_ix, dtype=np.intc).astype(np.int32)
+        rows, cols = (tgt, src) if reverse else (src, tgt)
+        # Stable sort keeps each row's edges in insertion order
+        indices = cols[np.argsort(rows, kind="stable")]
+        indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+        return indptr, indices
+
+    @property
+    def graph(self) -> nx.DiGraph:
+        """The chain as a ``networkx.DiGraph``, for NetworkX algorithms.
+
+        Built on first access and rebuilt after the chain is mutated; changes
+        made to the returned graph are not reflected in the chain.
+        """
+        if self._graph_cache is not None and self._graph_cache[0] == self._version:
+            return self._graph_cache[1]
+
+        g = nx.DiGraph()
+        for eid, entity in self._entities.items():
+            g.add_node(eid, entity_type=type(entity).__name__, data=entity)
+        for u, v, edge_type, resource_id, description in zip(*self.relationship_columns()):
+            g.add_edge(u, v, edge_type=edge_type, resource_id=resource_id,
+                       description=description)
+        self._graph_cache = (self._version, g)
+        return g
 
     @property
-    def entities(self) -> dict[str, Entity]:
-        return dict(self._entities)
+    def entities(self) -> Mapping[str, Entity]:
+        """Read-only live view of the chain's entities, keyed by id."""
+        return self._entities_view
 
     @property
     def relationships(self) -> list[dict[str, Any]]:
-        result = []
-        for u, v, data in self.graph.edges(data=True):
-            result.append({"source": u, "target": v, **data})
+        """Relationship records in insertion order, built fresh on each access."""
+        return self._relationship_records()
+
+    def relationship_columns(self) -> RelationshipColumns:
+        """Relationships as parallel lists, without building per-edge dicts."""
+        return RelationshipColumns(
+            self._rel_src, self._rel_tgt, self._rel_type,
+            self._rel_resource, self._rel_desc,
+        )
+
+    def _relationship_records(self) -> list[dict[str, Any]]:
+        return [
+            {"source": u, "target": v, "edge_type": edge_type,
+             "resource_id": resource_id, "description": description}
+            for u, v, edge_type, resource_id, description in zip(*self.relationship_columns())
+        ]
+
+    def snapshot(self) -> dict[str, Any]:
+        """Flat, serializable view of the chain shared by the exporters.
+
+        ``entities`` holds one ``{id, type, name, data}`` dict per entity,
+        where ``data`` is the entity's JSON-mode dump. The entity and
+        relationship lists are cached until the chain is next mutated, so
+        treat everything in the result as read-only.
+        """
+        cached = self._snapshot_cached
+        if cached is None or cached[0] != self._version:
+            values = list(self._entities.values())
+            entities = [
+                {"id": e.id, "type": type(e).__name__, "name": e.name, "data": data}
+                for e, data in zip(values, EntityAdapter.dump_python(values, mode="json"))
+            ]
+            cached = (self._version, entities, self._relationship_records())
+            self._snapshot_cached = cached
+        return {
+            "id": self.chain_id,
+            "name": self.name,
+            "description": self.description,
+            "entities": cached[1],
+            "relationships": cached[2],
+        }
+
+    def _cached(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Return ``fn()``, memoized under ``key`` until the chain is mutated.
+
+        Used for derived analysis results; callers must not modify them.
+        """
+        hit = self._cache.get(key)
+        if hit is not None and hit[0] == self._version:
+            return hit[1]
+        result = fn()
+        self._cache[key] = (self._version, result)
         return result
 
+    def _kahn_topo(self) -> list[str]:
+        """Topologically sort node IDs with Kahn's algorithm.
+
+        The result is cached until the chain is next mutated. Nodes on or
+        downstream of a cycle are missing from the returned order.
+        """
+        if self._topo_cached is not None and self._topo_cached[0] == self._version:
+            return self._topo_cached[1]
+
+        adj = self._succ
+        indeg = {n: len(preds) for n, preds in self._pred.items()}
+
+        queue = deque(n for n, d in indeg.items() if d == 0)
+        order = []
+        while queue:
+            u = queue.popleft()
+            order.append(u)
+            for v in adj[u]:
+                indeg[v] -= 1
+                if indeg[v] == 0:
+                    queue.append(v)
+
+        self._topo_cached = (self._version, order)
+        return order
+
     def get_chain(self) -> list[str]:
         """Return topologically sorted node IDs (full operation sequence)."""
-        if not nx.is_directed_acyclic_graph(self.graph):
+        if not self.is_valid_dag():
             raise ValueError("Chain contains cycles - not a valid DAG")
-        return list(nx.topological_sort(self.graph))
+        return list(self._kahn_topo())
 
     def get_critical_path(self) -> list[str]:
         """Compute the critical path (longest path through the DAG).
@@ -74,41 +287,56 @@ class HybridChain:
         Uses duration_hours for Action nodes as weights; other nodes weight 0.
         Returns ordered list of node IDs on the critical path.
         """
-        if not nx.is_directed_acyclic_graph(self.graph):
-            raise ValueError("Chain contains cycles - not a valid DAG")
-
-        if len(self.graph.nodes) == 0:
+        order = self.get_chain()
+        if not order:
             return []
 
-        # Weight = duration of target node (for Actions)
-        def _weight(u: str, v: str) -> float:
-            entity = self._entities.get(v)
-            if isinstance(entity, Action) and entity.duration_hours:
-                return -entity.duration_hours  # negative for longest path
-            return 0
-
-        # Add virtual source/sink
-        sources = [n for n in self.graph.nodes if self.graph.in_degree(n) == 0]
-        sinks = [n for n in self.graph.nodes if self.graph.out_degree(n) == 0]
-
-        if not sources or not sinks:
-            return list(nx.topological_sort(self.graph))
-
-        g = self.graph.copy()
-        g.add_node("__src__")
-        g.add_node("__sink__")
-        for s in sources:
-            g.add_edge("__src__", s)
-        for s in sinks:
-            g.add_edge(s, "__sink__")
-
-        # Bellman-Ford with negative weights = longest path
-        try:
-            path = nx.bellman_ford_path(g, "__src__", "__sink__",
-                                         weight=lambda u, v, d: _weight(u, v))
-            return [n for n in path if n not in ("__src__", "__sink__")]
-        except nx.NetworkXNoPath:
-            return []
+        # Weight = duration of the node (for Actions); a path's length is the
+        # sum of the weights of every node on it.
+        durations = dict.fromkeys(self._entities, 0.0)
+        for action in self.get_entities_by_type(Action):
+            durations[action.id] = action.duration_hours or 0.0
+
+        if _kernels.HAVE_NUMBA and len(order) >= _kernels.MIN_NODES:
+            return self._critical_path_compiled(order, durations)
+
+        # Longest-path DP in topological order. Every non-source node keeps a
+        # predecessor so the path always runs from a source to a sink.
+        dist = durations.copy()
+        pred: dict[str, str] = {}
+        adj = self._succ
+        for u in order:
+            for v in adj[u]:
+                cand = dist[u] + durations[v]
+                if cand > dist[v] or v not in pred:
+                    dist[v] = cand
+                    pred[v] = u
+
+        sinks = [n for n in order if not adj[n]]
+        end = max(sinks, key=dist.__getitem__)
+        path = [end]
+        while path[-1] in pred:
+            path.append(pred[path[-1]])
+        path.reverse()
+        return path
+
+    def _critical_path_compiled(self, order: list[str], durations: dict[str, float]) -> list[str]:
+        """`get_critical_path` DP run by the Numba kernel over CSR arrays."""
+        np = _kernels.np
+        idx = self._idx
+        indptr, indices = self.as_csr()
+        topo = np.fromiter((idx[n] for n in order), dtype=np.int32, count=len(order))
+        weights = np.zeros(len(order), dtype=np.float64)
+        for nid, hours in durations.items():
+            weights[idx[nid]] = hours
+        dist, pred = _kernels.longest_path(indptr, indices, topo, weights)
+
+        sinks = topo[indptr[topo + 1] == indptr[topo]]
+        end = int(sinks[np.argmax(dist[sinks])])
+        path = [end]
+        while pred[path[-1]] >= 0:
+            path.append(int(pred[path[-1]]))
+        return [self._rev_idx[i] for i in reversed(path)]
 
     def intervention_score(self, node_id: str) -> int:
         """Score a node by how many downstream nodes depend on it.
@@ -116,13 +344,26 @@ class HybridChain:
         Returns the number of nodes reachable from this node (descendants).
         Higher = more impactful intervention point.
         """
-        if node_id not in self.graph:
+        if node_id not in self._entities:
             raise ValueError(f"Node '{node_id}' not in chain")
-        return len(nx.descendants(self.graph, node_id))
+        adj = self._succ
+        seen = {node_id}
+        stack = [node_id]
+        while stack:
+            for v in adj[stack.pop()]:
+                if v not in seen:
+                    seen.add(v)
+                    stack.append(v)
+        return len(seen) - 1
 
     def get_entities_by_type(self, entity_type: type) -> list[Entity]:
         """Return all entities of a given type."""
-        return [e for e in self._entities.values() if isinstance(e, entity_type)]
+        return [e for t, bucket in self._by_type.items() if issubclass(t, entity_type)
+                for e in bucket]
 
     def is_valid_dag(self) -> bool:
-        return nx.is_directed_acyclic_graph(self.graph)
+        if self._dag_cached is not None and self._dag_cached[0] == self._version:
+            return self._dag_cached[1]
+        is_dag = len(self._kahn_topo()) == len(self._entities)
+        self._dag_cached = (self._version, is_dag)
+        return is_dag
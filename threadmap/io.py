@@ -2,183 +2,288 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime, timezone
-from typing import Any
+import time
+from functools import lru_cache, partial
+from io import StringIO
+from itertools import groupby
+from operator import itemgetter
+from typing import IO, Any, Callable, Iterator
 
 from .chain import HybridChain
 from .models import (
     Actor, Action, Capability, Infrastructure, Narrative, Target, Effect,
-    Relationship, EdgeType,
+    Relationship, EdgeType, EntityAdapter,
     ActorType, ActionDomain, CapabilityType, InfrastructureType,
     NarrativeType, EffectType,
 )
 from .analysis import find_chokepoints, intervention_ranking
 
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
 
 # --- JSON ---
 
 def to_json(chain: HybridChain) -> str:
     """Export chain to JSON string."""
+    snap = chain.snapshot()
     data = {
-        "id": chain.chain_id,
-        "name": chain.name,
-        "description": chain.description,
-        "entities": {eid: e.model_dump(mode="json") | {"_type": type(e).__name__}
-                     for eid, e in chain.entities.items()},
-        "relationships": chain.relationships,
+        "id": snap["id"],
+        "name": snap["name"],
+        "description": snap["description"],
+        "entities": {e["id"]: e["data"] | {"_type": e["type"]} for e in snap["entities"]},
+        "relationships": snap["relationships"],
     }
+    if orjson is not None:
+        return orjson.dumps(
+            data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode()
     return json.dumps(data, indent=2, default=str)
 
 
-def from_json(json_str: str) -> HybridChain:
-    """Import chain from JSON string."""
+_TYPE_MAP = {
+    "Actor": Actor, "Action": Action, "Capability": Capability,
+    "Infrastructure": Infrastructure, "Narrative": Narrative,
+    "Target": Target, "Effect": Effect,
+}
+
+# Enum-typed fields, coerced by hand when validation is skipped
+_ENUM_FIELDS = {
+    "Actor": {"actor_type": ActorType},
+    "Action": {"domain": ActionDomain},
+    "Capability": {"capability_type": CapabilityType},
+    "Infrastructure": {"infra_type": InfrastructureType},
+    "Narrative": {"narrative_type": NarrativeType},
+    "Effect": {"effect_type": EffectType},
+}
+
+
+def from_json(json_str: str, trusted: bool = True) -> HybridChain:
+    """Import chain from JSON string.
+
+    With ``trusted=True`` (for JSON produced by :func:`to_json`) models are
+    built with ``model_construct`` and skip validation. Pass
+    ``trusted=False`` to fully validate foreign input.
+    """
     data = json.loads(json_str)
     chain = HybridChain(data["id"], data["name"], data.get("description", ""))
 
-    type_map = {
-        "Actor": Actor, "Action": Action, "Capability": Capability,
-        "Infrastructure": Infrastructure, "Narrative": Narrative,
-        "Target": Target, "Effect": Effect,
-    }
+    # Entity dicts carry their class name under "_type"
+    if trusted:
+        entities = []
+        for edata in data["entities"].values():
+            etype = edata.pop("_type")
+            for field, enum in _ENUM_FIELDS.get(etype, {}).items():
+                if field in edata:
+                    edata[field] = enum(edata[field])
+            entities.append(_TYPE_MAP[etype].model_construct(**edata))
+        build_rel = Relationship.model_construct
+    else:
+        entities = EntityAdapter.validate_python(list(data["entities"].values()))
+        build_rel = Relationship
 
-    for eid, edata in data["entities"].items():
-        etype = edata.pop("_type")
-        cls = type_map[etype]
-        chain.add_entity(cls(**edata))
-
-    for rel in data["relationships"]:
-        chain.add_relationship(Relationship(
+    relationships = [
+        build_rel(
             source_id=rel["source"],
             target_id=rel["target"],
             edge_type=EdgeType(rel.get("edge_type", "dependency")),
             resource_id=rel.get("resource_id"),
             description=rel.get("description", ""),
-        ))
-
+        )
+        for rel in data["relationships"]
+    ]
+    chain.bulk_load(entities, relationships)
     return chain
 
 
 # --- STIX 2.1 ---
 
-_ENTITY_TO_STIX = {
-    "Actor": "threat-actor",
-    "Action": "attack-pattern",
-    "Capability": "tool",
-    "Infrastructure": "infrastructure",
-    "Narrative": "campaign",
-    "Target": "identity",
-    "Effect": "impact",
-}
+_STIX_STATIC = {"spec_version": "2.1"}
 
 
-def to_stix_bundle(chain: HybridChain) -> dict[str, Any]:
-    """Export chain as a STIX 2.1 bundle."""
-    objects = []
+@lru_cache(maxsize=1)
+def _iso_second(seconds: int) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+
+
+def _now_iso() -> str:
+    """Current UTC time as a STIX timestamp (microsecond precision).
+
+    The date/time prefix is only re-formatted when the second changes.
+    """
+    seconds, ns = divmod(time.time_ns(), 1_000_000_000)
+    return f"{_iso_second(seconds)}.{ns // 1000:06d}Z"
+
+
+def _stix_formatter(stix_type: str) -> Callable[[Any, dict[str, Any], str], dict[str, Any]]:
+    """Build the STIX object formatter for one entity type, with its type
+    string and id prefix bound up front."""
+    prefix = f"{stix_type}--"
 
-    for eid, entity in chain.entities.items():
-        etype = type(entity).__name__
-        stix_type = _ENTITY_TO_STIX.get(etype, "x-threadmap-entity")
-        stix_obj = {
+    def fmt(entity: Any, data: dict[str, Any], ts: str) -> dict[str, Any]:
+        obj = {
             "type": stix_type,
-            "spec_version": "2.1",
-            "id": f"{stix_type}--{entity.id}",
+            **_STIX_STATIC,
+            "id": prefix + entity.id,
             "name": entity.name,
-            "created": datetime.now(timezone.utc).isoformat(),
-            "modified": datetime.now(timezone.utc).isoformat(),
+            "created": ts,
+            "modified": ts,
         }
-        if hasattr(entity, "description") and entity.description:
-            stix_obj["description"] = entity.description
+        if desc := data.get("description"):
+            obj["description"] = desc
         # Store full ThreadMap data in extension
-        stix_obj["x_threadmap"] = entity.model_dump(mode="json")
-        objects.append(stix_obj)
-
-    for rel in chain.relationships:
-        src_entity = chain.get_entity(rel["source"])
-        tgt_entity = chain.get_entity(rel["target"])
-        src_type = _ENTITY_TO_STIX.get(type(src_entity).__name__, "x-threadmap-entity")
-        tgt_type = _ENTITY_TO_STIX.get(type(tgt_entity).__name__, "x-threadmap-entity")
-        objects.append({
+        obj["x_threadmap"] = data
+        return obj
+
+    return fmt
+
+
+_FORMATTERS: dict[type, Callable[[Any, dict[str, Any], str], dict[str, Any]]] = {
+    cls: _stix_formatter(cls.STIX_TYPE)
+    for cls in (Actor, Action, Capability, Infrastructure, Narrative, Target, Effect)
+}
+
+
+def _formatter_for(cls: type) -> Callable[[Any, dict[str, Any], str], dict[str, Any]]:
+    """Formatter for ``cls``, built on first use for entity types defined
+    outside this package."""
+    fmt = _FORMATTERS.get(cls)
+    if fmt is None:
+        fmt = _FORMATTERS[cls] = _stix_formatter(getattr(cls, "STIX_TYPE", "x-threadmap-entity"))
+    return fmt
+
+
+def _stix_objects(chain: HybridChain) -> Iterator[dict[str, Any]]:
+    """Yield the chain's STIX objects: entities first, then relationships."""
+    ts = _now_iso()
+
+    # STIX id of every entity, reused as relationship source/target refs
+    refs: dict[str, str] = {}
+    # One batched dump per export, not the chain's cached snapshot, so
+    # callers may modify the returned objects
+    values = list(chain.entities.values())
+    for entity, data in zip(values, EntityAdapter.dump_python(values, mode="json")):
+        obj = _formatter_for(type(entity))(entity, data, ts)
+        refs[entity.id] = obj["id"]
+        yield obj
+
+    cols = chain.relationship_columns()
+    for src, tgt, etype in zip(cols.source, cols.target, cols.edge_type):
+        yield {
             "type": "relationship",
-            "spec_version": "2.1",
-            "id": f"relationship--{rel['source']}--{rel['target']}",
-            "relationship_type": rel.get("edge_type", "dependency"),
-            "source_ref": f"{src_type}--{rel['source']}",
-            "target_ref": f"{tgt_type}--{rel['target']}",
-            "created": datetime.now(timezone.utc).isoformat(),
-            "modified": datetime.now(timezone.utc).isoformat(),
-        })
+            **_STIX_STATIC,
+            "id": f"relationship--{src}--{tgt}",
+            "relationship_type": etype,
+            "source_ref": refs[src],
+            "target_ref": refs[tgt],
+            "created": ts,
+            "modified": ts,
+        }
+
 
+def to_stix_bundle(chain: HybridChain) -> dict[str, Any]:
+    """Export chain as a STIX 2.1 bundle."""
     return {
         "type": "bundle",
         "id": f"bundle--{chain.chain_id}",
-        "objects": objects,
+        "objects": list(_stix_objects(chain)),
     }
 
 
+def to_stix_json(chain: HybridChain, *, stream: IO[str] | None = None) -> str | None:
+    """Export chain as compact STIX 2.1 bundle JSON.
+
+    Objects are encoded one at a time as they are produced, so the full
+    bundle never exists as a Python dict tree. Writes to ``stream`` and
+    returns None if one is given, otherwise returns the JSON string.
+    """
+    if orjson is not None:
+        def dumps(obj: Any) -> str:
+            return orjson.dumps(obj).decode()
+    else:
+        dumps = partial(json.dumps, separators=(",", ":"))
+
+    out = StringIO() if stream is None else stream
+    w = out.write
+    w(f'{{"type":"bundle","id":{dumps(f"bundle--{chain.chain_id}")},"objects":[')
+    sep = ""
+    for obj in _stix_objects(chain):
+        w(sep)
+        w(dumps(obj))
+        sep = ","
+    w("]}")
+    return out.getvalue() if stream is None else None
+
+
 # --- Markdown Report ---
 
 def to_markdown(chain: HybridChain) -> str:
     """Generate a Markdown analysis report for the chain."""
-    lines = [
-        f"# ThreadMap Report: {chain.name}",
-        "",
-        f"**Chain ID:** `{chain.chain_id}`",
-        "",
-    ]
+    buf = StringIO()
+    w = buf.write
+    w(f"# ThreadMap Report: {chain.name}\n\n**Chain ID:** `{chain.chain_id}`\n\n")
 
     if chain.description:
-        lines += [chain.description, ""]
+        w(f"{chain.description}\n\n")
 
     # Entities summary
-    lines += ["## Entities", ""]
+    w("## Entities\n\n")
+    snap = chain.snapshot()
+    # Entities usually arrive in same-type runs; merge run by run so a type
+    # that reappears later still lands in its first section
     by_type: dict[str, list] = {}
-    for eid, entity in chain.entities.items():
-        tname = type(entity).__name__
-        by_type.setdefault(tname, []).append(entity)
+    for tname, run in groupby(snap["entities"], key=itemgetter("type")):
+        by_type.setdefault(tname, []).extend(run)
 
     for tname, entities in by_type.items():
-        lines.append(f"### {tname}s ({len(entities)})")
-        lines.append("")
-        for e in entities:
-            desc = getattr(e, "description", "") or ""
-            lines.append(f"- **{e.name}** (`{e.id}`){': ' + desc if desc else ''}")
-        lines.append("")
+        w(f"### {tname}s ({len(entities)})\n\n")
+        w("".join(
+            f"- **{e['name']}** (`{e['id']}`)"
+            + (f": {e['data']['description']}" if e["data"].get("description") else "")
+            + "\n"
+            for e in entities
+        ))
+        w("\n")
 
     # Relationships
-    lines += ["## Relationships", ""]
-    for rel in chain.relationships:
-        etype = rel.get("edge_type", "?")
-        lines.append(f"- `{rel['source']}` →[{etype}]→ `{rel['target']}`")
-    lines.append("")
+    w("## Relationships\n\n")
+    cols = chain.relationship_columns()
+    w("".join(
+        f"- `{src}` →[{etype.value}]→ `{tgt}`\n"
+        for src, etype, tgt in zip(cols.source, cols.edge_type, cols.target)
+    ))
+    w("\n")
 
-    # Critical path
+    # Critical path (analyses are memoized on the chain until it changes)
     try:
-        cp = chain.get_critical_path()
-        lines += ["## Critical Path", "", " → ".join(f"`{n}`" for n in cp), ""]
+        cp = chain._cached("markdown:critical_path", chain.get_critical_path)
+        w("## Critical Path\n\n" + " → ".join(f"`{n}`" for n in cp) + "\n\n")
     except Exception:
         pass
 
     # Top interventions
     try:
-        interventions = intervention_ranking(chain)[:5]
-        lines += ["## Top Intervention Points", ""]
-        for i, iv in enumerate(interventions, 1):
-            lines.append(
-                f"{i}. **{iv['name']}** (`{iv['node_id']}`) — "
-                f"score: {iv['score']}, downstream impact: {iv['downstream_impact']}"
-            )
-        lines.append("")
+        interventions = chain._cached(
+            "markdown:interventions", lambda: intervention_ranking(chain, top_n=5))
+        w("## Top Intervention Points\n\n" + "".join(
+            f"{i}. **{iv['name']}** (`{iv['node_id']}`) — "
+            f"score: {iv['score']}, downstream impact: {iv['downstream_impact']}\n"
+            for i, iv in enumerate(interventions, 1)
+        ) + "\n")
     except Exception:
         pass
 
     # Chokepoints
     try:
-        cps = find_chokepoints(chain, top_n=5)
-        lines += ["## Chokepoints", ""]
-        for cp in cps:
-            lines.append(f"- `{cp['node_id']}`: {cp['downstream_count']} downstream nodes")
-        lines.append("")
+        cps = chain._cached("markdown:chokepoints", lambda: find_chokepoints(chain, top_n=5))
+        w("## Chokepoints\n\n" + "".join(
+            f"- `{cp['node_id']}`: {cp['downstream_count']} downstream nodes\n"
+            for cp in cps
+        ) + "\n")
     except Exception:
         pass
 
-    return "\n".join(lines)
+    # Every section ends with a blank line; the report ends with just one newline
+    return buf.getvalue()[:-1]
@@ -11,9 +11,9 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any
+from typing import Annotated, Any, ClassVar, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, TypeAdapter
 
 
 # --- Enums ---
@@ -79,18 +79,28 @@ class EdgeType(str, Enum):
 
 # --- Entity Models ---
 
-class Actor(BaseModel):
+class _FrozenModel(BaseModel):
+    """Base for chain models: immutable once built, so chain caches stay valid."""
+    model_config = ConfigDict(frozen=True)
+
+
+class Actor(_FrozenModel):
     """An entity that executes operations."""
+    STIX_TYPE: ClassVar[str] = "threat-actor"
+
     id: str
     name: str
     actor_type: ActorType
+    description: str = ""
     capabilities: list[str] = Field(default_factory=list)
     known_aliases: list[str] = Field(default_factory=list)
     attribution_confidence: float = 0.5
 
 
-class Action(BaseModel):
+class Action(_FrozenModel):
     """A single operation step - technical, cognitive, or hybrid."""
+    STIX_TYPE: ClassVar[str] = "attack-pattern"
+
     id: str
     name: str
     description: str = ""
@@ -106,8 +116,10 @@ class Action(BaseModel):
     detection_surface: list[str] = Field(default_factory=list)
 
 
-class Capability(BaseModel):
+class Capability(_FrozenModel):
     """A resource or capability that flows between actions."""
+    STIX_TYPE: ClassVar[str] = "tool"
+
     id: str
     name: str
     capability_type: CapabilityType
@@ -116,17 +128,22 @@ class Capability(BaseModel):
     ttl_hours: float | None = None
 
 
-class Infrastructure(BaseModel):
+class Infrastructure(_FrozenModel):
     """A platform or infrastructure where operations execute."""
+    STIX_TYPE: ClassVar[str] = "infrastructure"
+
     id: str
     name: str
     infra_type: InfrastructureType
+    description: str = ""
     reach_estimate: str | None = None
     detection_difficulty: float = 0.5
 
 
-class Narrative(BaseModel):
+class Narrative(_FrozenModel):
     """A cognitive/information operation narrative thread."""
+    STIX_TYPE: ClassVar[str] = "campaign"
+
     id: str
     name: str
     narrative_type: NarrativeType
@@ -136,8 +153,10 @@ class Narrative(BaseModel):
     platforms: list[str] = Field(default_factory=list)
 
 
-class Target(BaseModel):
+class Target(_FrozenModel):
     """A target of operations - individual, organization, or population."""
+    STIX_TYPE: ClassVar[str] = "identity"
+
     id: str
     name: str
     target_type: str = "organization"  # individual, organization, population
@@ -145,8 +164,10 @@ class Target(BaseModel):
     vulnerabilities: list[str] = Field(default_factory=list)
 
 
-class Effect(BaseModel):
+class Effect(_FrozenModel):
     """An outcome or impact of the operation chain."""
+    STIX_TYPE: ClassVar[str] = "impact"
+
     id: str
     name: str
     effect_type: EffectType
@@ -155,7 +176,7 @@ class Effect(BaseModel):
     reversibility: float = 0.5  # 0.0 (permanent) to 1.0 (trivially reversible)
 
 
-class Relationship(BaseModel):
+class Relationship(_FrozenModel):
     """An edge between two entities in the chain."""
     source_id: str
     target_id: str
@@ -166,3 +187,31 @@ class Relationship(BaseModel):
 
 # Union type for all entities
 Entity = Actor | Action | Capability | Infrastructure | Narrative | Target | Effect
+
+
+def _entity_tag(value: Any) -> str | None:
+    """Discriminate entities by class name, or by the ``_type`` key of a dict."""
+    if isinstance(value, dict):
+        return value.get("_type")
+    return type(value).__name__
+
+
+# Validates/dumps a whole list of entities in one pydantic-core call
+EntityAdapter = TypeAdapter(list[Annotated[
+    Union[
+        Annotated[Actor, Tag("Actor")],
+        Annotated[Action, Tag("Action")],
+        Annotated[Capability, Tag("Capability")],
+        Annotated[Infrastructure, Tag("Infrastructure")],
+        Annotated[Narrative, Tag("Narrative")],
+        Annotated[Target, Tag("Target")],
+        Annotated[Effect, Tag("Effect")],
+    ],
+    Discriminator(_entity_tag),
+]])
+
+# Integer tag per entity type, for table-driven dispatch in analysis loops
+TYPE_CODE: dict[type, int] = {
+    Actor: 0, Action: 1, Capability: 2, Infrastructure: 3,
+    Narrative: 4, Target: 5, Effect: 6,
+}
@@ -19,6 +19,8 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from .chain import HybridChain
 from .models import (
     Action,
@@ -40,6 +42,13 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Batch validators: one pydantic-core call per entity group
+_ACTORS = TypeAdapter(list[Actor])
+_ACTIONS = TypeAdapter(list[Action])
+_CAPABILITIES = TypeAdapter(list[Capability])
+_INFRASTRUCTURE = TypeAdapter(list[Infrastructure])
+_NARRATIVES = TypeAdapter(list[Narrative])
+
 
 def _role_to_actor_type(role: str) -> ActorType:
     """Map network engine role to ThreadMap actor type."""
@@ -83,28 +92,29 @@ def network_to_chain(
 
     # Create actors from top influential nodes
     top_nodes = intel.top_nodes(by="influence_score", n=20)
-    for op in top_nodes:
-        if op.influence_score <= 0:
-            continue
-        actor = Actor(
-            id=f"actor-{op.node}",
-            name=op.node,
-            actor_type=_role_to_actor_type(op.role),
-            capabilities=[op.role],
-            attribution_confidence=min(op.influence_score, 1.0),
-        )
-        chain.add_entity(actor)
+    actors = _ACTORS.validate_python([
+        {
+            "id": f"actor-{op.node}",
+            "name": op.node,
+            "actor_type": _role_to_actor_type(op.role),
+            "capabilities": [op.role],
+            "attribution_confidence": min(op.influence_score, 1.0),
+        }
+        for op in top_nodes if op.influence_score > 0
+    ])
 
     # Create infrastructure from communities
-    for cid, members in intel.communities.items():
-        infra = Infrastructure(
-            id=f"community-{cid}",
-            name=f"Community {cid} ({len(members)} members)",
-            infra_type=InfrastructureType.SOCIAL_MEDIA,
-            reach_estimate=str(len(members)),
-            detection_difficulty=0.3,
-        )
-        chain.add_entity(infra)
+    infras = _INFRASTRUCTURE.validate_python([
+        {
+            "id": f"community-{cid}",
+            "name": f"Community {cid} ({len(members)} members)",
+            "infra_type": InfrastructureType.SOCIAL_MEDIA,
+            "reach_estimate": str(len(members)),
+            "detection_difficulty": 0.3,
+        }
+        for cid, members in intel.communities.items()
+    ])
+    chain.bulk_load(actors + infras)
 
     # If we have an operation plan, model it as a chain of actions
     if plan:
@@ -116,78 +126,73 @@ def network_to_chain(
 def _add_plan_entities(chain: HybridChain, plan: Any, intel: Any) -> None:
     """Add operation plan as chain actions, targets, and relationships."""
 
-    # Entry points become initial recon/position actions
-    prev_action_id = None
-    for i, ep in enumerate(plan.entry_points):
-        action = Action(
-            id=f"entry-{i}",
-            name=f"Position at {ep['node']}",
-            description=f"Establish presence via {ep.get('role', 'unknown')} node (influence: {ep.get('influence_score', 0):.3f})",
-            domain=ActionDomain.COGNITIVE,
-            actor_id=f"actor-{ep['node']}" if f"actor-{ep['node']}" in {e.id for e in chain.entities.values()} else None,
-            success_probability=min(ep.get("influence_score", 0.5), 0.95),
-        )
-        chain.add_entity(action)
-
-        if prev_action_id:
-            chain.add_relationship(Relationship(
-                source_id=prev_action_id,
-                target_id=action.id,
-                edge_type=EdgeType.ENABLES,
-            ))
-        prev_action_id = action.id
-
-    # Amplification chain becomes sequential boost actions
-    for i, amp in enumerate(plan.amplification_chain):
-        action = Action(
-            id=f"amplify-{i}",
-            name=f"Amplify via {amp['node']}",
-            description=f"Content amplification through {amp.get('role', 'unknown')} (influence: {amp.get('influence_score', 0):.3f})",
-            domain=ActionDomain.COGNITIVE,
-            actor_id=f"actor-{amp['node']}" if f"actor-{amp['node']}" in {e.id for e in chain.entities.values()} else None,
-            success_probability=0.6,
-        )
-        chain.add_entity(action)
-
-        if prev_action_id:
-            chain.add_relationship(Relationship(
-                source_id=prev_action_id,
-                target_id=action.id,
-                edge_type=EdgeType.AMPLIFIES,
-            ))
-        prev_action_id = action.id
+    # Entry points become initial recon/position actions, followed by the
+    # amplification chain as sequential boost actions
+    known = chain.entities
+    records = [
+        {
+            "id": f"entry-{i}",
+            "name": f"Position at {ep['node']}",
+            "description": f"Establish presence via {ep.get('role', 'unknown')} node (influence: {ep.get('influence_score', 0):.3f})",
+            "domain": ActionDomain.COGNITIVE,
+            "actor_id": f"actor-{ep['node']}" if f"actor-{ep['node']}" in known else None,
+            "success_probability": min(ep.get("influence_score", 0.5), 0.95),
+        }
+        for i, ep in enumerate(plan.entry_points)
+    ]
+    edge_types = [EdgeType.ENABLES] * len(records)
+    records += [
+        {
+            "id": f"amplify-{i}",
+            "name": f"Amplify via {amp['node']}",
+            "description": f"Content amplification through {amp.get('role', 'unknown')} (influence: {amp.get('influence_score', 0):.3f})",
+            "domain": ActionDomain.COGNITIVE,
+            "actor_id": f"actor-{amp['node']}" if f"actor-{amp['node']}" in known else None,
+            "success_probability": 0.6,
+        }
+        for i, amp in enumerate(plan.amplification_chain)
+    ]
+    edge_types += [EdgeType.AMPLIFIES] * (len(records) - len(edge_types))
+    actions = _ACTIONS.validate_python(records)
+    # Everything below is collected here and inserted with one bulk_load
+    new_entities: list[Any] = list(actions)
+    new_rels = [
+        Relationship(source_id=prev.id, target_id=action.id, edge_type=etype)
+        for prev, action, etype in zip(actions, actions[1:], edge_types[1:])
+    ]
 
     # Target nodes become targets
     if hasattr(plan, "entry_points") and plan.entry_points:
         # Use entry point downstream as proxy for targets
-        target = Target(
+        new_entities.append(Target(
             id="target-network",
             name=f"Target network segment",
             target_type="population",
             description=f"Estimated reach: {plan.estimated_reach_pct:.1%}",
-        )
-        chain.add_entity(target)
+        ))
 
     # Weak links become capabilities (exploitable)
-    for i, wl in enumerate(plan.weak_links):
-        cap = Capability(
-            id=f"weakness-{i}",
-            name=f"Weak link: {wl['node']}",
-            capability_type=CapabilityType.ACCESS,
-            description=f"SPOF={wl.get('is_spof', False)}, fragmentation={wl.get('fragmentation_if_removed', 0):.3f}",
-            perishable=True,
-        )
-        chain.add_entity(cap)
+    new_entities += _CAPABILITIES.validate_python([
+        {
+            "id": f"weakness-{i}",
+            "name": f"Weak link: {wl['node']}",
+            "capability_type": CapabilityType.ACCESS,
+            "description": f"SPOF={wl.get('is_spof', False)}, fragmentation={wl.get('fragmentation_if_removed', 0):.3f}",
+            "perishable": True,
+        }
+        for i, wl in enumerate(plan.weak_links)
+    ])
 
     # Risk nodes as narrative threats
-    for i, rn in enumerate(plan.risk_nodes):
-        narrative = Narrative(
-            id=f"risk-{i}",
-            name=f"Risk: {rn['node']}",
-            narrative_type=NarrativeType.AMPLIFICATION,
-            description=rn.get("reason", ""),
-        )
-        chain.add_entity(narrative)
+    new_entities += _NARRATIVES.validate_python([
+        {
+            "id": f"risk-{i}",
+            "name": f"Risk: {rn['node']}",
+            "narrative_type": NarrativeType.AMPLIFICATION,
+            "description": rn.get("reason", ""),
+        }
+        for i, rn in enumerate(plan.risk_nodes)
+    ])
 
     # Final effect
     effect = Effect(
@@ -197,11 +202,13 @@ def _add_plan_entities(chain: HybridChain, plan: Any, intel: Any) -> None:
         severity=plan.estimated_reach_pct,
         reversibility=0.7,
     )
-    chain.add_entity(effect)
+    new_entities.append(effect)
 
-    if prev_action_id:
-        chain.add_relationship(Relationship(
-            source_id=prev_action_id,
+    if actions:
+        new_rels.append(Relationship(
+            source_id=actions[-1].id,
             target_id=effect.id,
             edge_type=EdgeType.TRIGGERS,
         ))
+
+    chain.bulk_load(new_entities, new_rels)